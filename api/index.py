@@ -1,9 +1,14 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
-from pydantic import BaseModel, Field
-from uuid import uuid4
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from dataclasses import dataclass
+from hashlib import blake2b
+import gzip
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic_core import to_json
+import orjson
 import os
 
 # Mangum only needed for Vercel/Lambda - not for Render
@@ -12,67 +17,139 @@ import os
 app = FastAPI(
     title="Job Skill Architecture API",
     description="POC API for demonstrating job skill architecture with required and recommended skills",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+class WildcardCORSMiddleware:
+    """
+    ASGI middleware allowing any origin, method and header without credentials.
+
+    Sends the same headers as CORSMiddleware(allow_origins=["*"], allow_methods=["*"],
+    allow_headers=["*"]) but skips its per-request header parsing and origin matching.
+    """
+
+    ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+    PREFLIGHT_HEADERS = {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT",
+        "Access-Control-Max-Age": "600",
+    }
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        has_origin = False
+        has_request_method = False
+        requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                has_origin = True
+            elif name == b"access-control-request-method":
+                has_request_method = True
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        # Same-origin and non-browser requests need no CORS headers
+        if not has_origin:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and has_request_method:
+            headers = dict(self.PREFLIGHT_HEADERS)
+            if requested_headers is not None:
+                # Allowing all headers means mirroring back whatever was requested
+                headers["Access-Control-Allow-Headers"] = requested_headers.decode("latin-1")
+            response = PlainTextResponse("OK", headers=headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), self.ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
 # Add CORS middleware for Vercel
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(WildcardCORSMiddleware)
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request, exc):
+    """Same as FastAPI's default handler, but encoded with orjson like the other responses"""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
 
 # Data Models
-class Identifier(BaseModel):
+# The sample-data records are never built from request input, so they are
+# plain slotted dataclasses rather than validating Pydantic models.
+@dataclass(frozen=True, slots=True)
+class Identifier:
     value: str
     schemeId: str = "UUID"
     description: Optional[str] = None
     schemeLink: Optional[str] = None
 
 
-class HiringOrganization(BaseModel):
+@dataclass(frozen=True, slots=True)
+class HiringOrganization:
     legalName: str
 
 
-class SkillAnnotation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SkillAnnotation:
     required: Optional[bool] = None
     preferred: Optional[bool] = None
     requiredAtHiring: Optional[bool] = None
 
 
-class JobSkill(BaseModel):
+@dataclass(frozen=True, slots=True)
+class JobSkill:
     name: str
+    description: Optional[str] = None
     uri: Optional[str] = None
     proficiency_level: Optional[str] = None
 
     annotation: Optional[SkillAnnotation] = None
 
 
-class Job(BaseModel):
-    identifiers: List[Identifier]
+@dataclass(frozen=True, slots=True)
+class Job:
+    identifiers: Tuple[Identifier, ...]
     hiringOrganization: HiringOrganization
     name: str
     positionID: str
     dateCreated: str
-    skills: List[JobSkill] = []
+    skills: Tuple[JobSkill, ...] = ()
 
 
-class Skill(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Skill:
     name: str
     description: Optional[str] = None
     proficiency_level: Optional[str] = None
 
 
 class JobWithSkillsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     job: Job
     required_skills: List[JobSkill]
     recommended_skills: List[JobSkill]
 
 
 # JEDx JobPosting Models (based on JobPostingType.json)
-class ScaleAnnotation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ScaleAnnotation:
     required: Optional[bool] = None
     preferred: Optional[bool] = None
     requiredAtHiring: Optional[bool] = None
@@ -81,20 +158,23 @@ class ScaleAnnotation(BaseModel):
     descriptions: Optional[List[str]] = None
 
 
-class AnnotatedDefinedTerm(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AnnotatedDefinedTerm:
     name: str
     termCode: Optional[str] = None
     descriptions: Optional[List[str]] = None
     annotation: Optional[ScaleAnnotation] = None
 
 
-class JDXOrganization(BaseModel):
+@dataclass(frozen=True, slots=True)
+class JDXOrganization:
     name: Optional[str] = None
     legalName: Optional[str] = None
     descriptions: Optional[List[str]] = None
 
 
-class Place(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Place:
     name: Optional[str] = None
     address: Optional[dict] = None
     descriptions: Optional[List[str]] = None
@@ -102,6 +182,8 @@ class Place(BaseModel):
 
 class JobPosting(BaseModel):
     """JobPosting model based on JobPostingType.json schema"""
+    model_config = ConfigDict(frozen=True)
+
     identifiers: Optional[List[Identifier]] = []
     name: Optional[str] = None
     title: Optional[str] = None
@@ -165,7 +247,8 @@ class JobPosting(BaseModel):
 
 
 # Sample Data
-sample_skills = [
+# Job identifiers are fixed UUIDs so the encoded responses are identical across processes
+sample_skills = (
     Skill(name="Python Programming", description="Proficiency in Python programming language", proficiency_level="Advanced"),
     Skill(name="FastAPI Development", description="Experience building REST APIs with FastAPI framework", proficiency_level="Advanced"),
     Skill(name="SQL Database Design", description="Ability to design and optimize SQL databases", proficiency_level="Proficient"),
@@ -174,16 +257,16 @@ sample_skills = [
     Skill(name="Git Version Control", description="Proficiency with Git for version control", proficiency_level="Advanced"),
     Skill(name="RESTful API Design", description="Understanding of REST principles and API design", proficiency_level="Proficient"),
     Skill(name="PostgreSQL", description="Experience with PostgreSQL database management", proficiency_level="Proficient"),
-]
+)
 
-sample_jobs = [
+sample_jobs = (
     Job(
-        identifiers=[Identifier(value=str(uuid4()), schemeId="UUID")],
+        identifiers=(Identifier(value="1df4e0c7-c818-4754-9577-703d86b3d986", schemeId="UUID"),),
         hiringOrganization=HiringOrganization(legalName="TechCorp Solutions"),
         name="Senior Backend Developer",
         positionID="JDX-001",
         dateCreated="2024-01-15T10:00:00Z",
-        skills=[
+        skills=(
             JobSkill(
                 name="Python Programming",
                 uri="https://example.com/skills/python-programming",
@@ -214,15 +297,15 @@ sample_jobs = [
                 proficiency_level="Developing",
                 annotation=SkillAnnotation(preferred=True)
             ),
-        ]
+        )
     ),
     Job(
-        identifiers=[Identifier(value=str(uuid4()), schemeId="UUID")],
+        identifiers=(Identifier(value="d3004644-8b69-4ea2-8de3-84ae088890c5", schemeId="UUID"),),
         hiringOrganization=HiringOrganization(legalName="DataSystems Inc"),
         name="Full Stack Developer",
         positionID="JDX-002",
         dateCreated="2024-02-01T09:30:00Z",
-        skills=[
+        skills=(
             JobSkill(
                 name="Python Programming",
                 uri="https://example.com/skills/python-programming",
@@ -253,15 +336,15 @@ sample_jobs = [
                 proficiency_level="Developing",
                 annotation=SkillAnnotation(preferred=True)
             ),
-        ]
+        )
     ),
     Job(
-        identifiers=[Identifier(value=str(uuid4()), schemeId="UUID")],
+        identifiers=(Identifier(value="8783319e-8e7a-4577-90ab-360670200e04", schemeId="UUID"),),
         hiringOrganization=HiringOrganization(legalName="CloudTech Innovations"),
         name="DevOps Engineer",
         positionID="JDX-003",
         dateCreated="2024-02-10T14:20:00Z",
-        skills=[
+        skills=(
             JobSkill(
                 name="Docker Containerization",
                 uri="https://example.com/skills/docker-containerization",
@@ -292,15 +375,63 @@ sample_jobs = [
                 proficiency_level="Proficient",
                 annotation=SkillAnnotation(preferred=True)
             ),
-        ]
+        )
     ),
-]
-
+)
 
-# API Endpoints
-@app.get("/")
-async def root():
-    """Serve the UI homepage"""
+# Lookup indexes over the sample data
+_JOBS_BY_ID: dict[str, Job] = {j.positionID: j for j in sample_jobs}
+# Skill names are matched case-insensitively, so the index is keyed by casefolded name
+_SKILLS_BY_FOLDED_NAME: dict[str, Skill] = {s.name.casefold(): s for s in sample_skills}
+
+
+# Bodies smaller than this are not worth gzipping
+GZIP_MINIMUM_SIZE = 512
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBody:
+    """A response body encoded once, with its strong ETag and optional gzipped copy"""
+    content: bytes
+    media_type: str
+    etag: str
+    gzipped: Optional[bytes] = None
+
+
+def _cache_body(content: bytes, media_type: str = "application/json") -> CachedBody:
+    """Wrap pre-encoded bytes together with an ETag and gzipped copy derived from them"""
+    gzipped = None
+    if len(content) >= GZIP_MINIMUM_SIZE:
+        # mtime=0 keeps the compressed bytes identical across processes
+        gzipped = gzip.compress(content, compresslevel=6, mtime=0)
+    etag = f'"{blake2b(content, digest_size=8).hexdigest()}"'
+    return CachedBody(content, media_type, etag, gzipped)
+
+
+def _cached_response(request: Request, cached: CachedBody) -> Response:
+    """Serve a cached body, gzipped when accepted, or a bodiless 304 if the client already holds it"""
+    headers = {"Cache-Control": "public, max-age=60"}
+    content, etag = cached.content, cached.etag
+    if cached.gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            # Same content in different bytes, so the ETag is weakened
+            content, etag = cached.gzipped, "W/" + cached.etag
+            headers["Content-Encoding"] = "gzip"
+    headers["ETag"] = etag
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as If-None-Match requires
+        tags = [tag.strip(" W/") for tag in if_none_match.split(",")]
+        if cached.etag in tags or "*" in tags:
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=cached.media_type, headers=headers)
+
+
+def _load_index_html() -> Optional[CachedBody]:
+    """Read the UI homepage from the first location that exists"""
     # Try multiple paths for Vercel deployment
     possible_paths = [
         os.path.join(os.path.dirname(__file__), "..", "public", "index.html"),
@@ -311,29 +442,159 @@ async def root():
     for html_path in possible_paths:
         try:
             if os.path.exists(html_path):
-                return FileResponse(html_path)
+                with open(html_path, "rb") as f:
+                    return _cache_body(f.read(), "text/html")
         except Exception:
             continue
+    return None
+
+
+# Resolved once per process so the homepage costs no filesystem calls per request
+_INDEX_HTML = _load_index_html()
+
+# Served by root() when the UI page is missing
+_ROOT_FALLBACK: CachedBody = _cache_body(orjson.dumps({
+    "message": "Job Skill Architecture API",
+    "version": "1.0.0",
+    "endpoints": {
+        "ui": "/",
+        "jobs": "/api/jobs",
+        "job_by_id": "/api/jobs/{job_id}",
+        "job_with_skills": "/api/jobs/{job_id}/skills",
+        "skills": "/api/skills",
+        "skill_by_name": "/api/skills/{skill_name}",
+        "skills_api": "/skills"
+    }
+}))
+
+
+# API Endpoints
+# Handlers are async def and only look up precomputed data, so they run on the
+# event loop without a threadpool hop. Keep blocking I/O out of them.
+@app.get("/")
+async def root(request: Request):
+    """Serve the UI homepage"""
+    if _INDEX_HTML is not None:
+        return _cached_response(request, _INDEX_HTML)
     
-    return JSONResponse(content={
-        "message": "Job Skill Architecture API",
-        "version": "1.0.0",
-        "endpoints": {
-            "ui": "/",
-            "jobs": "/api/jobs",
-            "job_by_id": "/api/jobs/{job_id}",
-            "job_with_skills": "/api/jobs/{job_id}/skills",
-            "skills": "/api/skills",
-            "skill_by_name": "/api/skills/{skill_name}",
-            "skills_api": "/skills"
-        }
-    })
+    return _cached_response(request, _ROOT_FALLBACK)
 
 
-@app.get("/api/jobs", response_model=List[Job])
-async def get_all_jobs():
+@app.get("/api/jobs", responses={200: {"model": List[Job]}})
+async def get_all_jobs(request: Request):
     """Get all jobs with their skills"""
-    return sample_jobs
+    return _cached_response(request, _CACHED_ALL_JOBS)
+
+
+# Responsibilities, requiredExperiences and requiredCredentials per positionID
+_RESPONSIBILITIES_BY_POSITION: dict[str, List[AnnotatedDefinedTerm]] = {
+    "JDX-001": [  # Senior Backend Developer
+        AnnotatedDefinedTerm(
+            name="Design and develop backend services",
+            descriptions=["Lead the design and implementation of scalable backend systems using Python and FastAPI.", "Architect scalable backend systems", "Design system integrations and data flows", "Lead technical design discussions and code reviews"]
+        ),
+        AnnotatedDefinedTerm(
+            name="Database management",
+            descriptions=["Manage and optimize PostgreSQL databases, ensuring data integrity and performance.", "Design and optimize database schemas", "Implement database migrations and versioning", "Monitor and tune database performance"]
+        ),
+        AnnotatedDefinedTerm(
+            name="API development",
+            descriptions=["Develop and maintain robust RESTful APIs for various client applications.", "Design RESTful API endpoints", "Implement API versioning and documentation", "Ensure API security and authentication"]
+        ),
+        AnnotatedDefinedTerm(
+            name="System Architecture",
+            descriptions=["Architect scalable backend systems", "Design system integrations and data flows", "Lead technical design discussions and code reviews"]
+        )
+    ],
+    "JDX-002": [  # Full Stack Developer
+        AnnotatedDefinedTerm(
+            name="Full Stack Development",
+            descriptions=["Develop both frontend and backend components of web applications", "Create responsive user interfaces and RESTful APIs", "Integrate frontend and backend systems"]
+        ),
+        AnnotatedDefinedTerm(
+            name="Collaborate with design team",
+            descriptions=["Work closely with designers to translate mockups into functional web applications", "Participate in design reviews and provide technical feedback", "Ensure UI/UX best practices"]
+        ),
+        AnnotatedDefinedTerm(
+            name="Maintain existing codebase",
+            descriptions=["Debug and improve existing features, ensuring high code quality", "Refactor legacy code", "Write and maintain unit tests"]
+        )
+    ],
+    "JDX-003": [  # DevOps Engineer
+        AnnotatedDefinedTerm(
+            name="Manage CI/CD pipelines",
+            descriptions=["Oversee and optimize continuous integration and continuous deployment pipelines", "Automate build, test, and deployment processes", "Monitor pipeline performance and reliability"]
+        ),
+        AnnotatedDefinedTerm(
+            name="Cloud infrastructure management",
+            descriptions=["Manage and provision cloud resources on AWS using Infrastructure as Code", "Design and implement scalable cloud architectures", "Optimize cloud costs and resource utilization"]
+        ),
+        AnnotatedDefinedTerm(
+            name="Container orchestration",
+            descriptions=["Implement and maintain Docker and Kubernetes solutions", "Manage containerized applications", "Ensure container security and best practices"]
+        )
+    ],
+}
+
+_REQUIRED_EXPERIENCES_BY_POSITION: dict[str, List[dict]] = {
+    "JDX-001": [  # Senior Backend Developer
+        {
+            "duration": "P5Y",
+            "descriptions": ["Backend software development experience"],
+            "experienceCategories": [{"descriptions": ["Work Experience"]}]
+        },
+        {
+            "duration": "P3Y",
+            "descriptions": ["API development and RESTful service design"],
+            "experienceCategories": [{"descriptions": ["Work Experience"]}]
+        }
+    ],
+    "JDX-002": [  # Full Stack Developer
+        {
+            "duration": "P3Y",
+            "descriptions": ["Full-stack web development"],
+            "experienceCategories": [{"descriptions": ["Work Experience"]}]
+        },
+        {
+            "duration": "P2Y",
+            "descriptions": ["Frontend framework experience (e.g., React, Vue)"],
+            "experienceCategories": [{"descriptions": ["Work Experience"]}]
+        }
+    ],
+    "JDX-003": [  # DevOps Engineer
+        {
+            "duration": "P4Y",
+            "descriptions": ["DevOps or infrastructure engineering experience"],
+            "experienceCategories": [{"descriptions": ["Work Experience"]}]
+        },
+        {
+            "duration": "P3Y",
+            "descriptions": ["AWS cloud services management"],
+            "experienceCategories": [{"descriptions": ["Work Experience"]}]
+        }
+    ],
+}
+
+_REQUIRED_CREDENTIALS_BY_POSITION: dict[str, List[dict]] = {
+    "JDX-001": [  # Senior Backend Developer
+        {
+            "programConcentration": "Computer Science",
+            "descriptions": ["BS"]
+        }
+    ],
+    "JDX-002": [  # Full Stack Developer
+        {
+            "programConcentration": "Software Engineering",
+            "descriptions": ["BS"]
+        }
+    ],
+    "JDX-003": [  # DevOps Engineer
+        {
+            "programConcentration": "Cloud Computing",
+            "descriptions": ["AWS Certified DevOps Engineer"]
+        }
+    ],
+}
 
 
 def transform_job_to_posting(job: Job) -> JobPosting:
@@ -355,116 +616,12 @@ def transform_job_to_posting(job: Job) -> JobPosting:
 
     hiring_org = JDXOrganization(legalName=job.hiringOrganization.legalName)
 
-    # Populate responsibilities, requiredExperiences, requiredCredentials based on job.positionID
-    responsibilities_data = []
-    required_experiences_data = []
-    required_credentials_data = []
+    responsibilities_data = _RESPONSIBILITIES_BY_POSITION.get(job.positionID, [])
+    required_experiences_data = _REQUIRED_EXPERIENCES_BY_POSITION.get(job.positionID, [])
+    required_credentials_data = _REQUIRED_CREDENTIALS_BY_POSITION.get(job.positionID, [])
 
-    if job.positionID == "JDX-001":  # Senior Backend Developer
-        responsibilities_data = [
-            AnnotatedDefinedTerm(
-                name="Design and develop backend services",
-                descriptions=["Lead the design and implementation of scalable backend systems using Python and FastAPI.", "Architect scalable backend systems", "Design system integrations and data flows", "Lead technical design discussions and code reviews"]
-            ),
-            AnnotatedDefinedTerm(
-                name="Database management",
-                descriptions=["Manage and optimize PostgreSQL databases, ensuring data integrity and performance.", "Design and optimize database schemas", "Implement database migrations and versioning", "Monitor and tune database performance"]
-            ),
-            AnnotatedDefinedTerm(
-                name="API development",
-                descriptions=["Develop and maintain robust RESTful APIs for various client applications.", "Design RESTful API endpoints", "Implement API versioning and documentation", "Ensure API security and authentication"]
-            ),
-            AnnotatedDefinedTerm(
-                name="System Architecture",
-                descriptions=["Architect scalable backend systems", "Design system integrations and data flows", "Lead technical design discussions and code reviews"]
-            )
-        ]
-        required_experiences_data = [
-            {
-                "duration": "P5Y",
-                "descriptions": ["Backend software development experience"],
-                "experienceCategories": [{"descriptions": ["Work Experience"]}]
-            },
-            {
-                "duration": "P3Y",
-                "descriptions": ["API development and RESTful service design"],
-                "experienceCategories": [{"descriptions": ["Work Experience"]}]
-            }
-        ]
-        required_credentials_data = [
-            {
-                "programConcentration": "Computer Science",
-                "descriptions": ["BS"]
-            }
-        ]
-    elif job.positionID == "JDX-002":  # Full Stack Developer
-        responsibilities_data = [
-            AnnotatedDefinedTerm(
-                name="Full Stack Development",
-                descriptions=["Develop both frontend and backend components of web applications", "Create responsive user interfaces and RESTful APIs", "Integrate frontend and backend systems"]
-            ),
-            AnnotatedDefinedTerm(
-                name="Collaborate with design team",
-                descriptions=["Work closely with designers to translate mockups into functional web applications", "Participate in design reviews and provide technical feedback", "Ensure UI/UX best practices"]
-            ),
-            AnnotatedDefinedTerm(
-                name="Maintain existing codebase",
-                descriptions=["Debug and improve existing features, ensuring high code quality", "Refactor legacy code", "Write and maintain unit tests"]
-            )
-        ]
-        required_experiences_data = [
-            {
-                "duration": "P3Y",
-                "descriptions": ["Full-stack web development"],
-                "experienceCategories": [{"descriptions": ["Work Experience"]}]
-            },
-            {
-                "duration": "P2Y",
-                "descriptions": ["Frontend framework experience (e.g., React, Vue)"],
-                "experienceCategories": [{"descriptions": ["Work Experience"]}]
-            }
-        ]
-        required_credentials_data = [
-            {
-                "programConcentration": "Software Engineering",
-                "descriptions": ["BS"]
-            }
-        ]
-    elif job.positionID == "JDX-003":  # DevOps Engineer
-        responsibilities_data = [
-            AnnotatedDefinedTerm(
-                name="Manage CI/CD pipelines",
-                descriptions=["Oversee and optimize continuous integration and continuous deployment pipelines", "Automate build, test, and deployment processes", "Monitor pipeline performance and reliability"]
-            ),
-            AnnotatedDefinedTerm(
-                name="Cloud infrastructure management",
-                descriptions=["Manage and provision cloud resources on AWS using Infrastructure as Code", "Design and implement scalable cloud architectures", "Optimize cloud costs and resource utilization"]
-            ),
-            AnnotatedDefinedTerm(
-                name="Container orchestration",
-                descriptions=["Implement and maintain Docker and Kubernetes solutions", "Manage containerized applications", "Ensure container security and best practices"]
-            )
-        ]
-        required_experiences_data = [
-            {
-                "duration": "P4Y",
-                "descriptions": ["DevOps or infrastructure engineering experience"],
-                "experienceCategories": [{"descriptions": ["Work Experience"]}]
-            },
-            {
-                "duration": "P3Y",
-                "descriptions": ["AWS cloud services management"],
-                "experienceCategories": [{"descriptions": ["Work Experience"]}]
-            }
-        ]
-        required_credentials_data = [
-            {
-                "programConcentration": "Cloud Computing",
-                "descriptions": ["AWS Certified DevOps Engineer"]
-            }
-        ]
-
-    return JobPosting(
+    # Inputs are the already-typed sample records, so skip re-validation
+    return JobPosting.model_construct(
         identifiers=job.identifiers,
         name=job.name,
         title=job.name,
@@ -481,89 +638,82 @@ def transform_job_to_posting(job: Job) -> JobPosting:
     )
 
 
-@app.get("/api/jobs/{job_id}", response_model=JobPosting)
-async def get_job_by_id(job_id: str):
+@app.get("/api/jobs/{job_id}", responses={200: {"model": JobPosting}})
+async def get_job_by_id(job_id: str, request: Request):
     """Get a specific job by position ID in JobPostingType format"""
-    job = next((j for j in sample_jobs if j.positionID == job_id), None)
-    if not job:
+    cached = _CACHED_JOB_POSTING.get(job_id)
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
-    
-    job_posting = transform_job_to_posting(job)
-    return job_posting
+    return _cached_response(request, cached)
+
+
+def partition_job_skills(job: Job) -> tuple[List[JobSkill], List[JobSkill]]:
+    """Split a job's skills into required and recommended"""
+    required_skills = []
+    recommended_skills = []
+    for skill in job.skills:
+        annotation = skill.annotation
+        if annotation is None:
+            continue
+        # Required wins over preferred, so a skill lands in at most one list
+        if annotation.required:
+            required_skills.append(skill)
+        elif annotation.preferred:
+            recommended_skills.append(skill)
+    return required_skills, recommended_skills
 
 
-@app.get("/api/jobs/{job_id}/skills", response_model=JobWithSkillsResponse)
-async def get_job_with_skills_architecture(job_id: str):
+@app.get("/api/jobs/{job_id}/skills", responses={200: {"model": JobWithSkillsResponse}})
+async def get_job_with_skills_architecture(job_id: str, request: Request):
     """Get a job with skills separated by required and recommended"""
-    job = next((j for j in sample_jobs if j.positionID == job_id), None)
-    if not job:
+    cached = _CACHED_JOB_WITH_SKILLS.get(job_id)
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
-    
-    required_skills = [
-        skill for skill in job.skills 
-        if skill.annotation and skill.annotation.required
-    ]
-    
-    recommended_skills = [
-        skill for skill in job.skills 
-        if skill.annotation and skill.annotation.preferred and not skill.annotation.required
-    ]
-    
-    return JobWithSkillsResponse(
-        job=job,
-        required_skills=required_skills,
-        recommended_skills=recommended_skills
-    )
+    return _cached_response(request, cached)
 
 
-@app.get("/api/skills", response_model=List[Skill])
-async def get_all_skills():
+@app.get("/api/skills", responses={200: {"model": List[Skill]}})
+async def get_all_skills(request: Request):
     """Get all available skills"""
-    return sample_skills
+    return _cached_response(request, _CACHED_ALL_SKILLS)
 
 
-@app.get("/api/skills/{skill_name}", response_model=Skill)
-async def get_skill_by_name(skill_name: str):
+@app.get("/api/skills/{skill_name}", responses={200: {"model": Skill}})
+async def get_skill_by_name(skill_name: str, request: Request):
     """Get a specific skill by name"""
-    skill = next((s for s in sample_skills if s.name.lower() == skill_name.lower()), None)
-    if not skill:
+    cached = _CACHED_SKILL_BY_NAME.get(skill_name.casefold())
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Skill '{skill_name}' not found")
-    return skill
+    return _cached_response(request, cached)
 
 
-@app.get("/api/jobs/{job_id}/skills/required", response_model=List[JobSkill])
-async def get_required_skills(job_id: str):
+@app.get("/api/jobs/{job_id}/skills/required", responses={200: {"model": List[JobSkill]}})
+async def get_required_skills(job_id: str, request: Request):
     """Get only required skills for a job"""
-    job = next((j for j in sample_jobs if j.positionID == job_id), None)
-    if not job:
+    cached = _CACHED_REQUIRED.get(job_id)
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
-    
-    return [
-        skill for skill in job.skills 
-        if skill.annotation and skill.annotation.required
-    ]
+    return _cached_response(request, cached)
 
 
-@app.get("/api/jobs/{job_id}/skills/recommended", response_model=List[JobSkill])
-async def get_recommended_skills(job_id: str):
+@app.get("/api/jobs/{job_id}/skills/recommended", responses={200: {"model": List[JobSkill]}})
+async def get_recommended_skills(job_id: str, request: Request):
     """Get only recommended skills for a job"""
-    job = next((j for j in sample_jobs if j.positionID == job_id), None)
-    if not job:
+    cached = _CACHED_RECOMMENDED.get(job_id)
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
-    
-    return [
-        skill for skill in job.skills 
-        if skill.annotation and skill.annotation.preferred and not skill.annotation.required
-    ]
+    return _cached_response(request, cached)
 
 
 # HROpen Skills API Models (based on openapi.yaml)
-class SkillKeyword(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SkillKeyword:
     name: str
     value: Optional[str] = None
 
 
-class HROpenSkill(BaseModel):
+@dataclass(frozen=True, slots=True)
+class HROpenSkill:
     """HROpen Skill model matching OpenAPI schema"""
     id: str  # URI format, required
     name: Optional[str] = None
@@ -576,62 +726,49 @@ class HROpenSkill(BaseModel):
 
 class ProficiencyLevel(BaseModel):
     """ProficiencyLevel model matching OpenAPI schema"""
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
     type: str = Field(default="DefinedTerm", alias="@type")
     name: str  # Required
-    
-    class Config:
-        populate_by_name = True
 
 
 class SkillAssertion(BaseModel):
     """SkillAssertion model matching OpenAPI schema"""
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
     type: str = Field(default="SkillAssertion", alias="@type")
     skill: HROpenSkill
     proficiencyLevel: ProficiencyLevel
     validationStatus: str  # Proposed, Validated, Provisional, Expired
     validFrom: str  # date-time format
     validUntil: Optional[str] = None  # date-time format
-    
-    class Config:
-        populate_by_name = True
 
 
-class ReferencedObject(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ReferencedObject:
     """ReferencedObject model matching OpenAPI schema"""
     id: Optional[str] = None  # URI
     type: Optional[str] = None  # e.g., JobPosting, Assessment, Person, Role
 
 
+SKILLS_API_CONTEXT = "https://schema.hropenstandards.org/4.5/recruiting/rdf/SkillsApi.json"
+
+
 class SkillsResponse(BaseModel):
     """SkillsResponse model matching OpenAPI schema"""
-    context: str = Field(
-        default="https://schema.hropenstandards.org/4.5/recruiting/rdf/SkillsApi.json",
-        alias="@context"
-    )
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
+    context: str = Field(default=SKILLS_API_CONTEXT, alias="@context")
     object: Optional[ReferencedObject] = None
     proficiencyScales: Optional[List[dict]] = []
     skills: List[SkillAssertion]
-    
-    class Config:
-        populate_by_name = True
 
 
-@app.get("/skills", response_model=SkillsResponse)
-async def get_skills_api(identifier: str):
+def transform_job_to_skills_response(job: Job) -> SkillsResponse:
     """
-    HROpen Skills API endpoint - Get skill assertions for a JEDx object
-    
-    Maps JEDx job skills to the Skills API format.
+    Map JEDx job skills to the Skills API format.
     Proficiency levels: Required/Preferred skills -> "Proficient"/"Advanced", Preferred only -> "Developing"
     """
-    # Extract job ID from identifier URI (e.g., "https://api.hropenstandards.org/jedx/jobs/JDX-001" or "JDX-001")
-    job_id = identifier.split("/")[-1] if "/" in identifier else identifier
-    
-    # Find the job
-    job = next((j for j in sample_jobs if j.positionID == job_id), None)
-    if not job:
-        raise HTTPException(status_code=404, detail=f"Job with identifier {identifier} not found")
-    
     # Build skill assertions from job skills
     skill_assertions = []
     for job_skill in job.skills:
@@ -688,6 +825,75 @@ async def get_skills_api(identifier: str):
     )
 
 
+@app.get("/skills", responses={200: {"model": SkillsResponse}})
+async def get_skills_api(identifier: str, request: Request):
+    """
+    HROpen Skills API endpoint - Get skill assertions for a JEDx object
+    
+    Maps JEDx job skills to the Skills API format.
+    Proficiency levels: Required/Preferred skills -> "Proficient"/"Advanced", Preferred only -> "Developing"
+    """
+    # Extract job ID from identifier URI (e.g., "https://api.hropenstandards.org/jedx/jobs/JDX-001" or "JDX-001")
+    job_id = identifier.rpartition("/")[2]
+    
+    cached = _CACHED_SKILLS_API.get(job_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail=f"Job with identifier {identifier} not found")
+    return _cached_response(request, cached)
+
+
+# Precomputed responses
+# sample_jobs and sample_skills never change at runtime, so every response body
+# is encoded to JSON once at import and the endpoints just serve the bytes.
+# The dataclass records are encoded through shared TypeAdapters so pydantic-core
+# serializes them from their schema instead of inspecting each value.
+_JOBS_ADAPTER = TypeAdapter(Tuple[Job, ...])
+_SKILLS_ADAPTER = TypeAdapter(Tuple[Skill, ...])
+_SKILL_ADAPTER = TypeAdapter(Skill)
+_JOB_SKILLS_ADAPTER = TypeAdapter(List[JobSkill])
+
+_CACHED_ALL_JOBS: CachedBody = _cache_body(_JOBS_ADAPTER.dump_json(sample_jobs))
+_CACHED_ALL_SKILLS: CachedBody = _cache_body(_SKILLS_ADAPTER.dump_json(sample_skills))
+_CACHED_SKILL_BY_NAME: dict[str, CachedBody] = {
+    name: _cache_body(_SKILL_ADAPTER.dump_json(s)) for name, s in _SKILLS_BY_FOLDED_NAME.items()
+}
+_POSTINGS_BY_ID: dict[str, JobPosting] = {
+    job_id: transform_job_to_posting(job) for job_id, job in _JOBS_BY_ID.items()
+}
+_CACHED_JOB_POSTING: dict[str, CachedBody] = {
+    job_id: _cache_body(to_json(posting)) for job_id, posting in _POSTINGS_BY_ID.items()
+}
+
+_REQUIRED_BY_JOB: dict[str, List[JobSkill]] = {}
+_RECOMMENDED_BY_JOB: dict[str, List[JobSkill]] = {}
+for _job_id, _job in _JOBS_BY_ID.items():
+    _REQUIRED_BY_JOB[_job_id], _RECOMMENDED_BY_JOB[_job_id] = partition_job_skills(_job)
+_CACHED_REQUIRED: dict[str, CachedBody] = {
+    job_id: _cache_body(_JOB_SKILLS_ADAPTER.dump_json(skills)) for job_id, skills in _REQUIRED_BY_JOB.items()
+}
+_CACHED_RECOMMENDED: dict[str, CachedBody] = {
+    job_id: _cache_body(_JOB_SKILLS_ADAPTER.dump_json(skills)) for job_id, skills in _RECOMMENDED_BY_JOB.items()
+}
+_JOB_WITH_SKILLS_BY_ID: dict[str, JobWithSkillsResponse] = {
+    job_id: JobWithSkillsResponse(
+        job=job,
+        required_skills=_REQUIRED_BY_JOB[job_id],
+        recommended_skills=_RECOMMENDED_BY_JOB[job_id]
+    )
+    for job_id, job in _JOBS_BY_ID.items()
+}
+_CACHED_JOB_WITH_SKILLS: dict[str, CachedBody] = {
+    job_id: _cache_body(to_json(response)) for job_id, response in _JOB_WITH_SKILLS_BY_ID.items()
+}
+
+_SKILLS_RESPONSE_BY_JOB: dict[str, SkillsResponse] = {
+    job_id: transform_job_to_skills_response(job) for job_id, job in _JOBS_BY_ID.items()
+}
+_CACHED_SKILLS_API: dict[str, CachedBody] = {
+    job_id: _cache_body(to_json(response)) for job_id, response in _SKILLS_RESPONSE_BY_JOB.items()
+}
+
+
 # Serverless handler (for Vercel/Lambda - not needed for Render)
 # Uncomment if deploying to Vercel:
 # handler = Mangum(app)